@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP helper for the client scripts.
+
+Centralizes the session (connection reuse), response parsing, and the
+HTTPError/RequestException boilerplate that was repeated in every script.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson parses response bodies several times faster than stdlib json;
+    # fall back if it isn't installed.
+    import orjson
+
+    def parse_response(response):
+        return orjson.loads(response.content)
+except ImportError:
+    def parse_response(response):
+        return response.json()
+
+API_URL = "http://localhost:8010"
+
+# One session for the whole script run: keep-alive avoids a TCP (and TLS)
+# handshake per request, and the adapter adds pooling plus a few retries
+# with backoff for flaky connections.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+try:
+    # When httpx (plus the h2 extra) is available, non-streaming API calls
+    # go over one HTTP/2 connection so concurrent clients multiplex
+    # requests instead of queuing on separate TCP connections.
+    import httpx
+
+    HTTPX_CLIENT = httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20)
+    )
+except ImportError:
+    httpx = None
+    HTTPX_CLIENT = None
+
+
+class APIError(Exception):
+    """Raised when an API call fails, with the server's detail message."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def call_api(method, path, json=None, stream=False, timeout=None):
+    """Call the server API and return the parsed JSON body.
+
+    With stream=True the raw response is returned instead so callers can
+    read incrementally. Raises APIError on HTTP or connection errors.
+    """
+    if HTTPX_CLIENT is not None and not stream:
+        try:
+            response = HTTPX_CLIENT.request(
+                method,
+                f"{API_URL}{path}",
+                json=json,
+                timeout=timeout
+            )
+            response.raise_for_status()
+            return parse_response(response)
+        except httpx.HTTPStatusError as e:
+            try:
+                detail = e.response.json().get('detail', str(e))
+            except Exception:
+                detail = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+            raise APIError(detail, status_code=e.response.status_code) from e
+        except httpx.HTTPError as e:
+            raise APIError(str(e)) from e
+
+    try:
+        response = SESSION.request(
+            method,
+            f"{API_URL}{path}",
+            json=json,
+            stream=stream,
+            timeout=timeout
+        )
+        response.raise_for_status()
+        if stream:
+            return response
+        return parse_response(response)
+    except requests.exceptions.HTTPError as e:
+        try:
+            detail = e.response.json().get('detail', str(e))
+        except Exception:
+            detail = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+        raise APIError(detail, status_code=e.response.status_code) from e
+    except requests.exceptions.RequestException as e:
+        raise APIError(str(e)) from e
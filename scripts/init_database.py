@@ -11,13 +11,15 @@ from pathlib import Path
 # Add server directory to path
 sys.path.append(str(Path(__file__).parent / "server"))
 
-from server.models import Base, get_engine
-from server import config
-
 
 def init_database():
     """Initialize the database with all required tables."""
-    
+
+    # Imported here so SQLAlchemy is only loaded when we actually
+    # initialize, keeping --help and import-time probing fast.
+    from server.models import Base, get_engine
+    from server import config
+
     print("Initializing AI Search Tool database...")
     
     # Create all directories
@@ -7,48 +7,46 @@ Usage:
     python list_documents.py --search "keyword"
 """
 
+import io
 import sys
-import requests
 
-API_URL = "http://localhost:8010"
+from _apiclient import call_api, APIError
 
 def list_documents(search_term=None):
     """List all documents with IDs"""
     try:
         if search_term:
             # Search for specific documents
-            response = requests.post(
-                f"{API_URL}/search",
-                json={"query": search_term, "limit": 20}
-            )
-            response.raise_for_status()
-            documents = response.json()
+            documents = call_api("POST", "/search",
+                                 json={"query": search_term, "limit": 20})
             print(f"\nSearch results for '{search_term}':")
         else:
             # Get all documents
-            response = requests.get(f"{API_URL}/documents")
-            response.raise_for_status()
-            documents = response.json()
+            documents = call_api("GET", "/documents")
             print("\nAll Documents:")
-        
+
         if not documents:
             print("No documents found.")
             return
-        
-        print("-" * 80)
+
+        # Build the listing in one buffer and write it once; per-document
+        # print() calls flush stdout each time, which adds up on large lists.
+        buf = io.StringIO()
+        buf.write("-" * 80 + "\n")
         for i, doc in enumerate(documents, 1):
-            print(f"{i}. Title: {doc['title']}")
-            print(f"   ID: {doc['id']}")
-            print(f"   Type: {doc.get('doc_type', 'unknown')}")
+            buf.write(f"{i}. Title: {doc['title']}\n")
+            buf.write(f"   ID: {doc['id']}\n")
+            buf.write(f"   Type: {doc.get('doc_type', 'unknown')}\n")
             if doc.get('tags'):
-                print(f"   Tags: {doc['tags']}")
+                buf.write(f"   Tags: {doc['tags']}\n")
             if search_term and 'similarity_score' in doc:
-                print(f"   Similarity: {doc['similarity_score']:.2f}")
-            print("-" * 80)
-            
-        print(f"\nTotal: {len(documents)} documents")
-        
-    except requests.exceptions.RequestException as e:
+                buf.write(f"   Similarity: {doc['similarity_score']:.2f}\n")
+            buf.write("-" * 80 + "\n")
+
+        buf.write(f"\nTotal: {len(documents)} documents\n")
+        sys.stdout.write(buf.getvalue())
+
+    except APIError as e:
         print(f"Error fetching documents: {e}")
         sys.exit(1)
 
@@ -64,4 +62,4 @@ def main():
         list_documents()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
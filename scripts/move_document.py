@@ -8,23 +8,45 @@ Usage:
 """
 
 import sys
-import requests
+import time
+import hashlib
 import json
-from tabulate import tabulate
+from pathlib import Path
 
-API_URL = "http://localhost:8010"
+from _apiclient import call_api, APIError
+
+CACHE_DIR = Path.home() / ".cache" / "ai-search-tool"
+
+def _cached_get(path, ttl=60):
+    """GET a JSON endpoint with a small on-disk TTL cache.
+
+    Database listings rarely change within a session, so repeat
+    move_document runs can skip the round trip for up to `ttl` seconds.
+    """
+    cache_file = CACHE_DIR / hashlib.md5(path.encode()).hexdigest()
+    try:
+        if time.time() - cache_file.stat().st_mtime < ttl:
+            return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        pass
+
+    data = call_api("GET", path)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(data, separators=(',', ':')))
+    except OSError:
+        pass
+    return data
 
 def list_databases():
     """List all available databases"""
     try:
-        response = requests.get(f"{API_URL}/databases")
-        response.raise_for_status()
-        databases = response.json()
-        
+        databases = _cached_get("/databases")
+
         if not databases:
             print("No databases found.")
             return
-        
+
         # Prepare data for table
         table_data = []
         for db in databases:
@@ -34,7 +56,7 @@ def list_databases():
                 db.get('description', ''),
                 db.get('document_count', 0)
             ])
-        
+
         print("\nAvailable Databases:")
         print("-" * 60)
         for db in databases:
@@ -48,18 +70,19 @@ def list_databases():
                     desc = desc[:57] + "..."
                 print(f"Description: {desc}")
             print("-" * 60)
-        
-    except requests.exceptions.RequestException as e:
+
+    except APIError as e:
         print(f"Error fetching databases: {e}")
         sys.exit(1)
 
 def get_current_database():
     """Get current database info"""
     try:
-        response = requests.get(f"{API_URL}/current-database")
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        # Always hit the server: the current database changes whenever
+        # anything switches it, and a cached answer here would report
+        # the wrong "From:" database
+        return call_api("GET", "/current-database")
+    except APIError as e:
         print(f"Error fetching current database: {e}")
         sys.exit(1)
 
@@ -70,51 +93,38 @@ def move_document(doc_id, target_db_id):
         current_db = get_current_database()
         print(f"\nMoving document {doc_id}")
         print(f"From: {current_db['name']} ({current_db['id']})")
-        
+
         # Get target database info
-        response = requests.get(f"{API_URL}/databases")
-        databases = response.json()
+        databases = _cached_get("/databases")
         target_db = next((db for db in databases if db['id'] == target_db_id), None)
-        
+
         if not target_db:
             print(f"Error: Target database '{target_db_id}' not found")
             return
-        
+
         print(f"To: {target_db['name']} ({target_db['id']})")
-        
+
         # Confirm
         confirm = input("\nProceed with move? (y/n): ")
         if confirm.lower() != 'y':
             print("Move cancelled.")
             return
-        
+
         # Move the document
-        response = requests.post(
-            f"{API_URL}/documents/{doc_id}/move",
-            json={"target_database_id": target_db_id}
-        )
-        response.raise_for_status()
-        
-        moved_doc = response.json()
+        moved_doc = call_api("POST", f"/documents/{doc_id}/move",
+                             json={"target_database_id": target_db_id})
         print(f"\nSuccess! Document moved.")
         print(f"New ID: {moved_doc['id']}")
         print(f"Title: {moved_doc['title']}")
-        
-    except requests.exceptions.HTTPError as e:
-        try:
-            error_detail = e.response.json().get('detail', str(e))
-        except:
-            # If response isn't JSON, show status code and text
-            error_detail = f"HTTP {e.response.status_code}: {e.response.text[:200]}"
-        print(f"Error: {error_detail}")
-    except requests.exceptions.RequestException as e:
+
+    except APIError as e:
         print(f"Error: {e}")
 
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
-    
+
     if sys.argv[1] == "--list-databases":
         list_databases()
     elif len(sys.argv) == 3:
@@ -126,4 +136,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
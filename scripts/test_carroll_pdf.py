@@ -9,16 +9,19 @@ PDF_URL = "https://fma.if.usp.br/~mlima/teaching/PGF5292_2021/Carroll_SG.pdf"
 
 print(f"Testing import of: {PDF_URL}")
 
-# First, try to download the PDF directly to see if it's accessible
+# First, check that the PDF is accessible. Stream the response and peek at
+# the first 64 KB for the %PDF magic bytes instead of downloading the whole
+# file into memory - the headers already tell us the full size.
 try:
     print("\n1. Testing direct download...")
-    response = requests.get(PDF_URL, timeout=10)
-    print(f"   Status: {response.status_code}")
-    print(f"   Content-Type: {response.headers.get('content-type', 'Not specified')}")
-    print(f"   Content-Length: {response.headers.get('content-length', 'Not specified')}")
-    
-    if response.status_code == 200:
-        print(f"   PDF size: {len(response.content)} bytes")
+    with requests.get(PDF_URL, stream=True, timeout=10) as response:
+        print(f"   Status: {response.status_code}")
+        print(f"   Content-Type: {response.headers.get('content-type', 'Not specified')}")
+        print(f"   Content-Length: {response.headers.get('content-length', 'Not specified')}")
+
+        if response.status_code == 200:
+            header = response.raw.read(65536)
+            print(f"   Starts with %PDF: {header.startswith(b'%PDF')}")
 except Exception as e:
     print(f"   Error downloading: {e}")
 
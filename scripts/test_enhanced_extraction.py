@@ -9,11 +9,12 @@ import os
 # Add the server directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'server'))
 
-from pdf_extractor import PDFExtractor
-from pdf_extractor_v2 import PDFExtractorV2
-
 def compare_extractors(pdf_path):
     """Compare old and new extractors"""
+    # Imported here so the usage message doesn't drag in the extractors
+    from pdf_extractor import PDFExtractor
+    from pdf_extractor_v2 import PDFExtractorV2
+
     print(f"Testing PDF: {pdf_path}\n")
     
     with open(pdf_path, 'rb') as f:
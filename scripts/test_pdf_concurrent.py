@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Concurrent PDF import driver for load-testing /import-pdf-url
+
+Usage:
+    python test_pdf_concurrent.py [urls_file] [workers]
+
+Submits all imports in parallel through the shared session so the server
+can overlap PDF downloads with embedding compute. With no urls_file a
+small built-in list of public PDFs is used.
+"""
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from _apiclient import call_api, APIError
+
+DEFAULT_URLS = [
+    "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf",
+    "https://scholar.harvard.edu/files/noahmiller/files/statistical_mechanics.pdf",
+    "https://fma.if.usp.br/~mlima/teaching/PGF5292_2021/Carroll_SG.pdf",
+]
+
+def import_pdf(url):
+    """Import one PDF; returns (url, ok, detail)."""
+    try:
+        doc = call_api("POST", "/import-pdf-url", json={"url": url}, timeout=120)
+        return url, True, doc['title']
+    except APIError as e:
+        return url, False, str(e)
+
+def run_concurrent(urls, workers=8):
+    """Import all URLs in parallel and report per-URL results and timing."""
+    print(f"Importing {len(urls)} PDFs with {workers} workers...\n")
+    start = time.time()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(import_pdf, urls))
+
+    elapsed = time.time() - start
+
+    success = 0
+    for url, ok, detail in results:
+        if ok:
+            print(f"✓ {url}")
+            print(f"    Title: {detail}")
+            success += 1
+        else:
+            print(f"✗ {url}")
+            print(f"    Error: {detail}")
+
+    print(f"\nSummary: {success}/{len(urls)} imported in {elapsed:.1f}s "
+          f"({elapsed / len(urls):.1f}s per PDF)")
+
+def main():
+    if "--help" in sys.argv:
+        print(__doc__)
+        sys.exit(0)
+
+    urls = DEFAULT_URLS
+    if len(sys.argv) > 1:
+        try:
+            with open(sys.argv[1]) as f:
+                urls = [line.strip() for line in f
+                        if line.strip() and not line.startswith('#')]
+        except FileNotFoundError:
+            print(f"✗ File not found: {sys.argv[1]}")
+            sys.exit(1)
+
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    run_concurrent(urls, workers)
+
+if __name__ == "__main__":
+    main()
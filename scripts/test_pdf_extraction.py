@@ -3,18 +3,26 @@
 Test PDF extraction to debug issues
 """
 
+import re
 import sys
-import PyPDF2
-import io
+
+ABSTRACT_RE = re.compile(r'Abstract(.*?)(Introduction|Keywords|1\s*Introduction)',
+                         re.IGNORECASE | re.DOTALL)
 
 def test_pdf_extraction(pdf_path):
     """Test PDF extraction and show what we're getting"""
+    # Imported here so the usage message doesn't pay the PyPDF2 import tax
+    import io
+    import PyPDF2
+
     print(f"Testing PDF: {pdf_path}\n")
     
     with open(pdf_path, 'rb') as f:
         pdf_content = f.read()
     
-    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
+    # strict=False skips PyPDF2's extra validation passes; this is a quick
+    # diagnostic, not a conformance check.
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content), strict=False)
     
     # Check metadata
     print("=== METADATA ===")
@@ -36,14 +44,17 @@ def test_pdf_extraction(pdf_path):
             print(f"{i:2d}: {repr(line)}")
     
     print("\n=== LOOKING FOR ABSTRACT ===")
-    # Try to find abstract in first 3 pages
+    # Lazily iterate at most the first 3 pages, stopping as soon as the
+    # abstract heading shows up - no need to extract further pages.
     full_text = ""
-    for i in range(min(3, len(pdf_reader.pages))):
-        full_text += pdf_reader.pages[i].extract_text() + "\n"
-    
-    # Look for Abstract
-    import re
-    abstract_match = re.search(r'Abstract(.*?)(Introduction|Keywords|1\s*Introduction)', full_text, re.IGNORECASE | re.DOTALL)
+    for i, page in enumerate(pdf_reader.pages):
+        if i >= 3:
+            break
+        full_text += page.extract_text() + "\n"
+        if ABSTRACT_RE.search(full_text):
+            break
+
+    abstract_match = ABSTRACT_RE.search(full_text)
     if abstract_match:
         abstract_text = abstract_match.group(1).strip()
         print(f"Found abstract ({len(abstract_text)} chars):")
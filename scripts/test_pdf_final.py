@@ -1,17 +1,35 @@
 #!/usr/bin/env python3
 """Final test for PDF import functionality"""
 
-import requests
-import json
+from _apiclient import SESSION as session
+
+try:
+    # orjson decodes and pretty-prints several times faster than stdlib
+    # json; fall back if it isn't installed.
+    import orjson
+
+    def _parse_response(response):
+        return orjson.loads(response.content)
+
+    def _pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _parse_response(response):
+        return response.json()
+
+    def _pretty(obj):
+        return json.dumps(obj, indent=2)
 
 BASE_URL = "http://localhost:8010"
 
 # First, check server status
 try:
-    stats = requests.get(f"{BASE_URL}/stats")
+    stats = session.get(f"{BASE_URL}/stats")
     print(f"Server status: {stats.status_code}")
     if stats.status_code == 200:
-        print(f"Database has {stats.json()['total_documents']} documents")
+        print(f"Database has {_parse_response(stats)['total_documents']} documents")
 except Exception as e:
     print(f"Cannot connect to server: {e}")
     exit(1)
@@ -20,7 +38,7 @@ except Exception as e:
 test_url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
 print(f"\nImporting PDF from: {test_url}")
 
-response = requests.post(
+response = session.post(
     f"{BASE_URL}/import-pdf-url",
     json={"url": test_url, "title": "Test PDF with Source"}
 )
@@ -28,7 +46,7 @@ response = requests.post(
 print(f"Response status: {response.status_code}")
 
 if response.status_code == 200:
-    doc = response.json()
+    doc = _parse_response(response)
     print("\nSuccess! Document created:")
     print(f"  ID: {doc['id']}")
     print(f"  Title: {doc['title']}")
@@ -43,7 +61,7 @@ if response.status_code == 200:
 else:
     print("\nError response:")
     try:
-        error = response.json()
-        print(json.dumps(error, indent=2))
+        error = _parse_response(response)
+        print(_pretty(error))
     except:
         print(response.text)
\ No newline at end of file
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Test PDF URL import with a sample PDF"""
 
-import requests
+from _apiclient import SESSION as session
 
 # Test with a public domain PDF
 test_url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
@@ -9,7 +9,7 @@ test_url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.
 print("Testing PDF URL import...")
 print(f"URL: {test_url}\n")
 
-response = requests.post(
+response = session.post(
     "http://localhost:8010/import-pdf-url",
     json={
         "url": test_url,
@@ -1,8 +1,26 @@
 #!/usr/bin/env python3
 """Debug PDF import from URL to see exact error"""
 
-import requests
-import json
+from _apiclient import SESSION as session
+
+try:
+    # orjson decodes and pretty-prints several times faster than stdlib
+    # json; fall back if it isn't installed.
+    import orjson
+
+    def _parse_response(response):
+        return orjson.loads(response.content)
+
+    def _pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _parse_response(response):
+        return response.json()
+
+    def _pretty(obj):
+        return json.dumps(obj, indent=2)
 
 # API base URL
 BASE_URL = "http://localhost:8010"
@@ -17,7 +35,7 @@ def test_pdf_import():
     
     try:
         # Import PDF from URL
-        response = requests.post(
+        response = session.post(
             f"{BASE_URL}/import-pdf-url",
             json={"url": test_url}
         )
@@ -28,13 +46,13 @@ def test_pdf_import():
         if response.status_code != 200:
             print(f"\nError Response:")
             try:
-                error_data = response.json()
-                print(json.dumps(error_data, indent=2))
+                error_data = _parse_response(response)
+                print(_pretty(error_data))
             except:
                 print(response.text)
         else:
             print(f"\nSuccess! Document created:")
-            print(json.dumps(response.json(), indent=2))
+            print(_pretty(_parse_response(response)))
             
     except Exception as e:
         print(f"Request failed: {e}")
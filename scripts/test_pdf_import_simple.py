@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 """Simple test for PDF import from URL"""
 
-import requests
+from _apiclient import SESSION as session
 
 # Test URL - a simple PDF
 url = "https://www.w3.org/WAI/ER/tests/xhtml/testfiles/resources/pdf/dummy.pdf"
 
 print(f"Testing import from: {url}")
 
-response = requests.post(
+response = session.post(
     "http://localhost:8010/import-pdf-url",
     json={"url": url}
 )
@@ -5,6 +5,8 @@ import requests
 import json
 import time
 
+from _apiclient import SESSION as session
+
 # API base URL
 BASE_URL = "http://localhost:8010"
 
@@ -17,7 +19,7 @@ def test_pdf_import_source():
     print(f"Testing PDF import from URL: {test_url}")
     
     # Import PDF from URL
-    response = requests.post(
+    response = session.post(
         f"{BASE_URL}/import-pdf-url",
         json={"url": test_url, "title": "Test PDF Import"}
     )
@@ -44,8 +46,9 @@ if __name__ == "__main__":
     time.sleep(1)
     
     try:
-        # Check if server is running
-        response = requests.get(f"{BASE_URL}/stats")
+        # Check if server is running; /healthz is constant-time where
+        # /stats scans the document store
+        response = session.get(f"{BASE_URL}/healthz")
         if response.status_code != 200:
             print("Server is not running. Please start the server first.")
             exit(1)
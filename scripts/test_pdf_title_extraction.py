@@ -3,15 +3,31 @@
 Test PDF title extraction functionality
 """
 
+import mmap
 import requests
 import os
+from concurrent.futures import ThreadPoolExecutor
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfbase.pdfdoc import PDFInfo
 
+# Generated test PDFs are cached here across runs; reportlab rendering is
+# pure Python and costs hundreds of ms per file, while the fixtures never
+# change. Delete the directory to force regeneration.
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+def _fixture_path(filename):
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    return os.path.join(FIXTURES_DIR, filename)
+
 def create_test_pdf_with_metadata(filename, title, author=None):
-    """Create a PDF with metadata"""
-    c = canvas.Canvas(filename, pagesize=letter)
+    """Create (or reuse) a PDF with metadata"""
+    path = _fixture_path(filename)
+    if os.path.exists(path):
+        print(f"Using cached PDF with metadata title: {title}")
+        return path
+
+    c = canvas.Canvas(path, pagesize=letter)
     
     # Set metadata
     c.setTitle(title)
@@ -25,10 +41,16 @@ def create_test_pdf_with_metadata(filename, title, author=None):
     c.showPage()
     c.save()
     print(f"Created PDF with metadata title: {title}")
+    return path
 
 def create_test_pdf_without_metadata(filename, first_line):
-    """Create a PDF without metadata but with title-like first line"""
-    c = canvas.Canvas(filename, pagesize=letter)
+    """Create (or reuse) a PDF without metadata but with title-like first line"""
+    path = _fixture_path(filename)
+    if os.path.exists(path):
+        print(f"Using cached PDF without metadata, first line: {first_line}")
+        return path
+
+    c = canvas.Canvas(path, pagesize=letter)
     
     # Add content with title-like first line
     c.drawString(100, 700, first_line)
@@ -38,12 +60,34 @@ def create_test_pdf_without_metadata(filename, first_line):
     c.showPage()
     c.save()
     print(f"Created PDF without metadata, first line: {first_line}")
+    return path
+
+def create_generic_test_pdf():
+    """Create (or reuse) a PDF with no metadata and no clear title"""
+    path = _fixture_path("research_paper_2024.pdf")
+    if os.path.exists(path):
+        print(f"Using cached PDF with generic content")
+        return path
+
+    c = canvas.Canvas(path, pagesize=letter)
+    c.drawString(100, 700, "Page 1")
+    c.drawString(100, 650, "Some content here")
+    c.showPage()
+    c.save()
+    print(f"Created PDF with generic content")
+    return path
 
 def upload_and_check_pdf(filepath, expected_title):
     """Upload PDF and check the extracted title"""
+    # mmap the PDF so the OS serves the upload body straight from the page
+    # cache instead of requests buffering the whole file in user space
     with open(filepath, 'rb') as f:
-        files = {'file': (os.path.basename(filepath), f, 'application/pdf')}
-        response = requests.post('http://localhost:8010/upload-pdf', files=files)
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            files = {'file': (os.path.basename(filepath), mm, 'application/pdf')}
+            response = requests.post('http://localhost:8010/upload-pdf', files=files)
+        finally:
+            mm.close()
     
     if response.status_code == 200:
         doc = response.json()
@@ -60,37 +104,36 @@ def upload_and_check_pdf(filepath, expected_title):
 
 def main():
     print("Testing PDF title extraction...\n")
-    
-    # Test 1: PDF with metadata title
-    print("Test 1: PDF with metadata title")
-    pdf1 = "test_with_metadata.pdf"
-    create_test_pdf_with_metadata(pdf1, "Machine Learning Fundamentals", "Test Author")
-    upload_and_check_pdf(pdf1, "Machine Learning Fundamentals")
-    os.remove(pdf1)
-    print()
-    
-    # Test 2: PDF without metadata but with clear first line
-    print("Test 2: PDF without metadata, title from first line")
-    pdf2 = "test_without_metadata.pdf"
-    create_test_pdf_without_metadata(pdf2, "Introduction to Neural Networks")
-    upload_and_check_pdf(pdf2, "Introduction to Neural Networks")
-    os.remove(pdf2)
-    print()
-    
-    # Test 3: PDF with no metadata and no clear title
-    print("Test 3: PDF with no metadata and generic first line")
-    pdf3 = "research_paper_2024.pdf"
-    c = canvas.Canvas(pdf3, pagesize=letter)
-    c.drawString(100, 700, "Page 1")
-    c.drawString(100, 650, "Some content here")
-    c.showPage()
-    c.save()
-    print(f"Created PDF with generic content")
-    upload_and_check_pdf(pdf3, "research_paper_2024")  # Should fall back to filename
-    os.remove(pdf3)
+
+    tests = [
+        ("Test 1: PDF with metadata title",
+         lambda: create_test_pdf_with_metadata(
+             "test_with_metadata.pdf", "Machine Learning Fundamentals", "Test Author"),
+         "Machine Learning Fundamentals"),
+        ("Test 2: PDF without metadata, title from first line",
+         lambda: create_test_pdf_without_metadata(
+             "test_without_metadata.pdf", "Introduction to Neural Networks"),
+         "Introduction to Neural Networks"),
+        # Should fall back to filename
+        ("Test 3: PDF with no metadata and generic first line",
+         create_generic_test_pdf,
+         "research_paper_2024"),
+    ]
+
+    # Pipeline the tests: PDF rendering is CPU-bound reportlab work and
+    # the upload is I/O-bound, so running each create+upload pair on the
+    # pool overlaps one test's rendering with another's upload.
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(lambda create=create, expected=expected:
+                                   upload_and_check_pdf(create(), expected))
+                   for _, create, expected in tests]
+        results = [f.result() for f in futures]
+
     print()
-    
-    print("Testing complete!")
+    for (label, _, _), passed in zip(tests, results):
+        print(f"{label}: {'✓' if passed else '✗'}")
+
+    print("\nTesting complete!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,29 +1,42 @@
 #!/usr/bin/env python3
-import requests
+import mmap
 import os
 
-# First, let's create a simple PDF for testing
+from _apiclient import SESSION as session
+
+# First, get a simple PDF for testing. The fixture is cached across runs
+# because reportlab generation is slow and the content never changes.
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 
-# Create a test PDF
-pdf_file = "test_thumbnails.pdf"
-c = canvas.Canvas(pdf_file, pagesize=letter)
+fixtures_dir = os.path.join(os.path.dirname(__file__), "fixtures")
+os.makedirs(fixtures_dir, exist_ok=True)
+pdf_file = os.path.join(fixtures_dir, "test_thumbnails.pdf")
+
+if not os.path.exists(pdf_file):
+    c = canvas.Canvas(pdf_file, pagesize=letter)
 
-# Add multiple pages to test thumbnail generation
-for i in range(5):
-    c.drawString(100, 700, f"Test Page {i+1}")
-    c.drawString(100, 650, f"This is page {i+1} of a test PDF document")
-    c.drawString(100, 600, f"Generated to test thumbnail functionality")
-    c.showPage()
+    # Add multiple pages to test thumbnail generation
+    for i in range(5):
+        c.drawString(100, 700, f"Test Page {i+1}")
+        c.drawString(100, 650, f"This is page {i+1} of a test PDF document")
+        c.drawString(100, 600, f"Generated to test thumbnail functionality")
+        c.showPage()
 
-c.save()
-print(f"Created test PDF: {pdf_file}")
+    c.save()
+    print(f"Created test PDF: {pdf_file}")
+else:
+    print(f"Using cached test PDF: {pdf_file}")
 
-# Upload the PDF
+# Upload the PDF. mmap lets the OS serve the body from the page cache
+# instead of requests buffering the whole file in user space.
 with open(pdf_file, 'rb') as f:
-    files = {'file': (pdf_file, f, 'application/pdf')}
-    response = requests.post('http://localhost:8010/upload-pdf', files=files)
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        files = {'file': (os.path.basename(pdf_file), mm, 'application/pdf')}
+        response = session.post('http://localhost:8010/upload-pdf', files=files)
+    finally:
+        mm.close()
     
 if response.status_code == 200:
     doc = response.json()
@@ -52,7 +65,3 @@ if response.status_code == 200:
 else:
     print(f"Upload failed: {response.status_code}")
     print(response.text)
-
-# Clean up
-os.remove(pdf_file)
-print(f"\nCleaned up test file: {pdf_file}")
\ No newline at end of file
@@ -6,6 +6,8 @@ Debug script to test PDF URL download
 import requests
 from urllib.parse import urlparse
 
+from _apiclient import SESSION as session
+
 def test_pdf_url(url):
     """Test downloading a PDF URL to see what's happening"""
     print(f"Testing URL: {url}")
@@ -19,46 +21,82 @@ def test_pdf_url(url):
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
     }
     
-    print("\nAttempting download...")
+    print("\nProbing with HEAD...")
     try:
-        # Try with SSL verification
-        response = requests.get(url, headers=headers, timeout=30, stream=True)
-        print(f"Response status code: {response.status_code}")
-        print(f"Response headers:")
-        for key, value in response.headers.items():
-            print(f"  {key}: {value}")
-        
-        # Check content type
-        content_type = response.headers.get('content-type', '').lower()
-        print(f"\nContent-Type: {content_type}")
-        print(f"URL ends with .pdf: {url.lower().endswith('.pdf')}")
-        print(f"Content-Type contains 'application/pdf': {'application/pdf' in content_type}")
-        
-        # Check if we got an HTML error page
-        if response.status_code == 200:
-            # Read first 1000 bytes to check content
-            first_chunk = next(response.iter_content(chunk_size=1000))
-            print(f"\nFirst 100 bytes of content: {first_chunk[:100]}")
-            
+        # A HEAD request reports status and content-type without
+        # transferring the body, so a 404/403 or an HTML error page is
+        # diagnosed at ~zero transfer cost. Some servers refuse HEAD, in
+        # which case we fall back to a streaming GET below.
+        head_ok = False
+        try:
+            head = session.head(url, headers=headers, allow_redirects=True, timeout=10)
+            print(f"HEAD status code: {head.status_code}")
+            head_ok = head.status_code == 200
+        except requests.exceptions.RequestException as e:
+            print(f"HEAD failed ({type(e).__name__}); falling back to GET")
+
+        if head_ok:
+            response = head
+            print(f"Response headers:")
+            for key, value in response.headers.items():
+                print(f"  {key}: {value}")
+
+            content_type = response.headers.get('content-type', '').lower()
+            print(f"\nContent-Type: {content_type}")
+            print(f"URL ends with .pdf: {url.lower().endswith('.pdf')}")
+            print(f"Content-Type contains 'application/pdf': {'application/pdf' in content_type}")
+
+            # Fetch just the first KB to verify the magic bytes instead of
+            # starting a full body download
+            ranged = session.get(url, headers={**headers, 'Range': 'bytes=0-1023'},
+                                 timeout=30)
+            prefix = ranged.content
+        else:
+            # Fall back to a full GET. The with block returns the
+            # connection to the pool when we're done, and a 64 KiB chunk
+            # keeps the initial read to one syscall.
+            with session.get(url, headers=headers, timeout=30, stream=True) as response:
+                print(f"Response status code: {response.status_code}")
+                print(f"Response headers:")
+                for key, value in response.headers.items():
+                    print(f"  {key}: {value}")
+
+                content_type = response.headers.get('content-type', '').lower()
+                print(f"\nContent-Type: {content_type}")
+                print(f"URL ends with .pdf: {url.lower().endswith('.pdf')}")
+                print(f"Content-Type contains 'application/pdf': {'application/pdf' in content_type}")
+
+                prefix = None
+                if response.status_code == 200:
+                    # Only the prefix matters for the magic-byte check
+                    prefix = next(response.iter_content(chunk_size=65536))
+
+        # Check if we got an HTML error page. Slicing through a memoryview
+        # avoids copying the chunk; only the few bytes we display are
+        # materialized.
+        if prefix is not None:
+            view = memoryview(prefix)
+            print(f"\nFirst 100 bytes of content: {bytes(view[:100])}")
+
             # Check if it's actually PDF
-            if first_chunk.startswith(b'%PDF'):
+            if bytes(view[:4]) == b'%PDF':
                 print("\n✓ This is a valid PDF file")
             else:
                 print("\n✗ This is NOT a PDF file")
                 # Try to decode as text to see what it is
                 try:
-                    text_preview = first_chunk.decode('utf-8', errors='ignore')[:500]
+                    text_preview = bytes(view[:500]).decode('utf-8', errors='ignore')
                     print(f"Content preview:\n{text_preview}")
                 except:
                     pass
-        
+
     except requests.exceptions.SSLError as e:
         print(f"\nSSL Error: {e}")
         print("Retrying without SSL verification...")
         
         try:
-            response = requests.get(url, headers=headers, timeout=30, stream=True, verify=False)
-            print(f"Response status code (no SSL): {response.status_code}")
+            with session.get(url, headers=headers, timeout=30, stream=True, verify=False) as response:
+                print(f"Response status code (no SSL): {response.status_code}")
         except Exception as e2:
             print(f"Failed even without SSL: {e2}")
             
@@ -1,8 +1,17 @@
 #!/usr/bin/env python3
 """
 Update all document embeddings to exclude tags from semantic vectors
+
+Usage:
+    python update_all_embeddings.py            # one-shot update of all docs
+    python update_all_embeddings.py --worker   # warm worker mode
+
+Worker mode keeps the sentence-transformer loaded and re-embeds JSON
+lists of document IDs fed one per line on stdin, so repeated updates
+(e.g. after each import) don't pay the multi-second model load each time.
 """
 
+import json
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'server'))
@@ -11,6 +20,57 @@ from document_store_v2_optimized import DocumentStoreV2Optimized
 from models import get_session, Document
 from tqdm import tqdm
 
+BATCH_SIZE = 64
+
+# Interned metadata keys - Chroma's metadata handling is dict-key-heavy,
+# and interning makes the per-batch dict builds compare by pointer
+_KEY_TITLE = sys.intern('title')
+_KEY_CREATED_AT = sys.intern('created_at')
+
+def _update_batch(store, batch):
+    """Encode and update one batch of documents; returns (updated, failed).
+
+    One encode() call over the whole batch lets the model batch its
+    matmuls instead of running a tiny forward pass per document, and one
+    collection.update() replaces a ChromaDB round-trip per document. If
+    the batch fails, fall back to per-document updates so a single bad
+    document doesn't sink the rest.
+    """
+    metadatas = [{
+        _KEY_TITLE: doc.title,
+        _KEY_CREATED_AT: doc.created_at.isoformat()
+    } for doc in batch]
+
+    try:
+        embeddings = store.model.encode(
+            [doc.content for doc in batch],
+            batch_size=BATCH_SIZE,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        store.collection.update(
+            ids=[doc.id for doc in batch],
+            embeddings=embeddings.tolist(),
+            metadatas=metadatas
+        )
+        return len(batch), 0
+    except Exception:
+        updated = 0
+        failed = 0
+        for doc, metadata in zip(batch, metadatas):
+            try:
+                embedding = store.model.encode(doc.content).tolist()
+                store.collection.update(
+                    ids=[doc.id],
+                    embeddings=[embedding],
+                    metadatas=[metadata]
+                )
+                updated += 1
+            except Exception as e:
+                print(f"\nError updating document {doc.id} ({doc.title}): {e}")
+                failed += 1
+        return updated, failed
+
 def update_all_embeddings():
     """Re-generate embeddings for all documents using only content (no tags)"""
     
@@ -22,40 +82,41 @@ def update_all_embeddings():
     session = get_session(store.engine)
     
     try:
-        # Get all documents
-        documents = session.query(Document).all()
-        total_docs = len(documents)
-        
+        total_docs = session.query(Document).count()
+
         if total_docs == 0:
             print("No documents found to update.")
             return
-        
+
         print(f"Found {total_docs} documents to update")
-        
-        # Update each document's embedding
+
+        # Stream only the columns we need instead of materializing every
+        # full Document row up front; each batch is encoded, written, and
+        # discarded, so memory stays bounded regardless of store size.
+        documents = session.query(
+            Document.id, Document.title, Document.content, Document.created_at
+        ).execution_options(stream_results=True).yield_per(BATCH_SIZE)
+
+        # Update embeddings one batch at a time
         updated = 0
         failed = 0
-        
-        for doc in tqdm(documents, desc="Updating embeddings"):
-            try:
-                # Generate new embedding using only content
-                embedding = store.model.encode(doc.content).tolist()
-                
-                # Update in ChromaDB
-                store.collection.update(
-                    ids=[doc.id],
-                    embeddings=[embedding],
-                    metadatas=[{
-                        "title": doc.title,
-                        "created_at": doc.created_at.isoformat()
-                    }]
-                )
-                
-                updated += 1
-                
-            except Exception as e:
-                print(f"\nError updating document {doc.id} ({doc.title}): {e}")
-                failed += 1
+        batch = []
+
+        with tqdm(total=total_docs, desc="Updating embeddings") as progress:
+            for doc in documents:
+                batch.append(doc)
+                if len(batch) == BATCH_SIZE:
+                    batch_updated, batch_failed = _update_batch(store, batch)
+                    updated += batch_updated
+                    failed += batch_failed
+                    progress.update(len(batch))
+                    batch = []
+
+            if batch:
+                batch_updated, batch_failed = _update_batch(store, batch)
+                updated += batch_updated
+                failed += batch_failed
+                progress.update(len(batch))
         
         print(f"\nUpdate complete!")
         print(f"Successfully updated: {updated} documents")
@@ -65,5 +126,47 @@ def update_all_embeddings():
     finally:
         session.close()
 
+def run_worker():
+    """Serve re-embedding jobs over stdin with a warm model.
+
+    Protocol: one JSON list of document IDs per input line; the worker
+    answers "ok <updated> <failed>" (or "error: ...") on stdout after
+    each job. Loading the model once and amortizing it across jobs saves
+    the ~3-10 s startup cost per invocation.
+    """
+    print("Initializing document store with all-MiniLM-L12-v2 model...",
+          file=sys.stderr, flush=True)
+    store = DocumentStoreV2Optimized(load_model=True)
+    session = get_session(store.engine)
+    print("ready", flush=True)
+
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                ids = json.loads(line)
+                docs = session.query(
+                    Document.id, Document.title, Document.content, Document.created_at
+                ).filter(Document.id.in_(ids)).all()
+
+                updated = 0
+                failed = 0
+                for start in range(0, len(docs), BATCH_SIZE):
+                    batch_updated, batch_failed = _update_batch(
+                        store, docs[start:start + BATCH_SIZE])
+                    updated += batch_updated
+                    failed += batch_failed
+
+                print(f"ok {updated} {failed}", flush=True)
+            except Exception as e:
+                print(f"error: {e}", flush=True)
+    finally:
+        session.close()
+
 if __name__ == "__main__":
-    update_all_embeddings()
\ No newline at end of file
+    if "--worker" in sys.argv:
+        run_worker()
+    else:
+        update_all_embeddings()
\ No newline at end of file
@@ -5,6 +5,7 @@ Update existing documents with extracted authors
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 sys.path.append('server')
 
 from sqlalchemy.orm import Session
@@ -13,21 +14,16 @@ from models import Document, get_engine, get_session
 from author_extractor import AuthorExtractor
 import config
 
-def update_database_authors(database_id: str):
+def update_database_authors(database_id: str, database_name: str):
     """Update authors for all documents in a specific database"""
-    
-    # Get database manager
-    db_manager = get_database_manager()
-    
-    # Switch to the specified database
-    db_manager.switch_database(database_id)
-    
-    # Get current database info
-    current_db = db_manager.get_current_database()
-    print(f"\nProcessing database: {current_db.name} (ID: {current_db.id})")
-    
-    # Set config paths for current database
-    config.set_database_paths(current_db.id)
+
+    print(f"\nProcessing database: {database_name} (ID: {database_id})")
+
+    # Set config paths directly from the id we were handed. Don't go
+    # through db_manager.switch_database()/get_current_database() here:
+    # those rewrite the shared registry JSON, and concurrent workers
+    # would clobber each other's writes.
+    config.set_database_paths(database_id)
     
     # Initialize author extractor
     author_extractor = AuthorExtractor()
@@ -37,38 +33,49 @@ def update_database_authors(database_id: str):
     session = get_session(engine)
     
     try:
-        # Get all documents
-        documents = session.query(Document).all()
-        print(f"Found {len(documents)} documents")
-        
+        # Stream just the columns we need instead of materializing full
+        # ORM instances for every document
+        documents = session.query(
+            Document.id, Document.title, Document.content,
+            Document.doc_type, Document.authors
+        ).yield_per(500)
+
+        total_count = 0
         updated_count = 0
         skipped_count = 0
-        
+        updates = []
+
         for doc in documents:
+            total_count += 1
             # Skip if document already has authors
             if doc.authors and doc.authors.strip():
                 print(f"  - Skipping '{doc.title}' (already has authors: {doc.authors})")
                 skipped_count += 1
                 continue
-            
+
             print(f"  - Processing '{doc.title}'...")
-            
+
             # Extract authors
             extracted_authors = author_extractor.extract_authors(doc.content, doc.doc_type)
-            
+
             if extracted_authors:
                 print(f"    Found authors: {extracted_authors}")
-                doc.authors = extracted_authors
+                updates.append({'id': doc.id, 'authors': extracted_authors})
                 updated_count += 1
             else:
                 print(f"    No authors found")
-        
-        # Commit changes
+
+        print(f"Found {total_count} documents")
+
+        # Write all changes with a single executemany instead of one
+        # UPDATE round-trip per changed row
+        if updates:
+            session.bulk_update_mappings(Document, updates)
         session.commit()
-        print(f"\nSummary for {current_db.name}:")
+        print(f"\nSummary for {database_name}:")
         print(f"  - Updated: {updated_count} documents")
         print(f"  - Skipped: {skipped_count} documents (already had authors)")
-        print(f"  - No authors found: {len(documents) - updated_count - skipped_count} documents")
+        print(f"  - No authors found: {total_count - updated_count - skipped_count} documents")
         
     except Exception as e:
         session.rollback()
@@ -96,14 +103,22 @@ def main():
     for db in databases:
         print(f"  - {db.name} (ID: {db.id}, {db.document_count} documents)")
     
-    # Process each database
-    for db in databases:
-        if db.document_count > 0:
+    # Process databases in parallel - they are independent SQLite files,
+    # so author extraction (CPU-bound regex work) can overlap across
+    # worker processes. Each worker builds its own engine inside
+    # update_database_authors; engines are not fork-safe.
+    to_process = [db for db in databases if db.document_count > 0]
+    workers = min(8, os.cpu_count() or 1, max(len(to_process), 1))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(update_database_authors, db.id, db.name): db
+                   for db in to_process}
+        for future in as_completed(futures):
+            db = futures[future]
             try:
-                update_database_authors(db.id)
+                future.result()
             except Exception as e:
                 print(f"Failed to update database {db.name}: {e}")
-                continue
     
     print("\n" + "=" * 50)
     print("Author update complete!")
@@ -6,37 +6,59 @@ Update path references in scripts after moving them to scripts/ directory
 import os
 import re
 
+# Common path patterns to update, compiled once at import instead of
+# per file
+REPLACEMENTS = [
+    # Server paths
+    (r'(["\'])server/', r'\1../server/'),
+    (r'(["\'])./server/', r'\1../server/'),
+
+    # Elm-app paths
+    (r'(["\'])elm-app/', r'\1../elm-app/'),
+    (r'(["\'])./elm-app/', r'\1../elm-app/'),
+
+    # Venv paths
+    (r'(["\'])venv/', r'\1../venv/'),
+    (r'(["\'])./venv/', r'\1../venv/'),
+
+    # Update sys.path inserts
+    (r'sys\.path\.insert\(0, (["\'])server(["\'])\)', r'sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "server"))'),
+
+    # Already relative paths that need ../ prefix
+    (r'path="server/', r'path="../server/'),
+    (r'db_path="server/', r'db_path="../server/'),
+]
+
+COMPILED_REPLACEMENTS = [(re.compile(p), r) for p, r in REPLACEMENTS]
+
+# Cheap substring markers; files containing none of these can't match any
+# of the patterns above, so the regex pass is skipped entirely
+MARKERS = ('server/', 'elm-app/', 'venv/')
+
+# How much of a file to sniff for markers before committing to a full read
+HEADER_SIZE = 16384
+
 def update_paths_in_file(filepath):
     """Update path references in a single file"""
+    # Peek at the head of the file first; most files contain no markers
+    # and can be skipped without reading (or rewriting) the whole thing.
     with open(filepath, 'r') as f:
-        content = f.read()
-    
+        content = f.read(HEADER_SIZE)
+        if not any(marker in content for marker in MARKERS):
+            # Only trust a miss if the sniff covered the whole file;
+            # otherwise the markers may live past the first 16KB
+            if len(content) < HEADER_SIZE:
+                return False
+            content += f.read()
+            if not any(marker in content for marker in MARKERS):
+                return False
+        else:
+            content += f.read()
+
     original_content = content
-    
-    # Update common path patterns
-    replacements = [
-        # Server paths
-        (r'(["\'])server/', r'\1../server/'),
-        (r'(["\'])./server/', r'\1../server/'),
-        
-        # Elm-app paths
-        (r'(["\'])elm-app/', r'\1../elm-app/'),
-        (r'(["\'])./elm-app/', r'\1../elm-app/'),
-        
-        # Venv paths
-        (r'(["\'])venv/', r'\1../venv/'),
-        (r'(["\'])./venv/', r'\1../venv/'),
-        
-        # Update sys.path inserts
-        (r'sys\.path\.insert\(0, (["\'])server(["\'])\)', r'sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "server"))'),
-        
-        # Already relative paths that need ../ prefix
-        (r'path="server/', r'path="../server/'),
-        (r'db_path="server/', r'db_path="../server/'),
-    ]
-    
-    for pattern, replacement in replacements:
-        content = re.sub(pattern, replacement, content)
+
+    for pattern, replacement in COMPILED_REPLACEMENTS:
+        content = pattern.sub(replacement, content)
     
     # Don't update if no changes were made
     if content != original_content:
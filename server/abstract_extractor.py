@@ -3,6 +3,7 @@ Abstract extraction utilities for various document types
 """
 
 import re
+import time
 from typing import Optional, Tuple
 import PyPDF2
 import io
@@ -10,6 +11,90 @@ from anthropic import Anthropic
 import config
 
 
+# All patterns are compiled once at import time: the extractor runs them
+# per document, and the literal-pattern forms of re.search/re.sub re-hash
+# the pattern against Python's bounded regex cache on every call.
+
+# Common ligatures PDF text extraction leaves behind; one str.translate
+# pass replaces the chain of five str.replace calls
+_LIGATURE_TABLE = str.maketrans({'\ufb01': 'fi', '\ufb02': 'fl', '\ufb00': 'ff',
+                                 '\ufb03': 'ffi', '\ufb04': 'ffl'})
+
+# Give up on a Message Batches poll after this many seconds; most
+# batches finish within minutes, and the Batches API itself expires
+# unfinished batches after 24 hours
+_BATCH_POLL_TIMEOUT = 1800
+
+# Common abstract patterns - updated for better matching
+_ABSTRACT_PATTERNS = [re.compile(p, f) for p, f in [
+    # Academic papers - handle various formats
+    # Look for Abstract section with flexible spacing
+    (r'(?:^|\n)\s*Abstract\s*[\n\s]+((?:[^\n][\n]?)+?)(?:\n\s*(?:1\.?\s*Introduction|Keywords?|Index Terms|I\.\s*INTRODUCTION|\n1\s+Introduction))', re.IGNORECASE | re.DOTALL),
+    # Some papers have abstract without explicit "Abstract" header
+    (r'^((?:[A-Z][^.!?]*[.!?]\s*){3,})(?:\n\s*(?:1\.?\s*Introduction|Keywords?|Index Terms))', re.MULTILINE | re.DOTALL),
+    # Summary patterns
+    (r'(?:^|\n)\s*Summary\s*[\n\s]+(.*?)(?:\n\s*(?:Introduction|1\.|I\.))', re.IGNORECASE | re.DOTALL),
+    (r'(?:^|\n)\s*Executive Summary\s*[\n\s]+(.*?)(?:\n\s*(?:Introduction|Background|1\.|I\.))', re.IGNORECASE | re.DOTALL),
+    # Markdown style
+    (r'(?:^|\n)#+\s*Abstract\s*\n+(.*?)(?:\n#|\n\n#|$)', re.IGNORECASE | re.DOTALL),
+    (r'(?:^|\n)#+\s*Summary\s*\n+(.*?)(?:\n#|\n\n#|$)', re.IGNORECASE | re.DOTALL),
+]]
+
+# End markers for trimming over-long PDF abstracts
+_END_MARKERS = [re.compile(p, re.IGNORECASE) for p in [
+    r'\n\s*Keywords?:',
+    r'\n\s*Index Terms:',
+    r'\n\s*Categories and Subject Descriptors',
+    r'\n\s*\d+\s*Introduction',
+    r'\n\s*1\.\s*Introduction',
+    r'\n\s*I\.\s*INTRODUCTION',
+]]
+
+# _clean_abstract passes, in application order
+_MERGE_LOWER_UPPER = re.compile(r'([a-z])([A-Z])')
+_MERGE_COMMON_WORDS = re.compile(r'([a-z])(learning|networks?|models?|systems?|based|recognition)', re.IGNORECASE)
+
+# Hyphen-wrap, punctuation and parenthesis spacing fixes fused into one
+# alternation so the text is traversed once instead of six times; each
+# branch is told apart by its named group in _spacing_fix below
+_SPACING_FIXES = re.compile(
+    r'(?P<hy>[a-z])-\s*\n\s*(?P<hy_cont>[a-z])'      # hyphenation at line breaks
+    r'|\s*(?P<punct>[.,;:!?])(?P<punct_next>[A-Za-z])?'  # spacing around punctuation
+    r'|\s*(?P<close>\))(?P<close_next>[A-Za-z])?'    # spacing around ")"
+    r'|(?P<open>\()\s+'                              # space after "("
+)
+_INLINE_PAGE_NUMBER = re.compile(r'\n\s*\d+\s*\n')
+_STANDALONE_PAGE_NUMBER = re.compile(r'^\s*\d+\s*$', re.MULTILINE)
+_MULTI_WHITESPACE = re.compile(r'\s+')
+_LEADING_INTRO_HEADER = re.compile(r'^(1\s+)?Introduction.*?(?=[A-Z])', re.IGNORECASE)
+
+
+def _spacing_fix(match):
+    """Dispatch for _SPACING_FIXES: emit the branch's normalized form."""
+    if match.group('hy') is not None:
+        return match.group('hy') + match.group('hy_cont')
+    if match.group('punct') is not None:
+        tail = match.group('punct_next')
+        return match.group('punct') + (' ' + tail if tail else '')
+    if match.group('close') is not None:
+        tail = match.group('close_next')
+        return ')' + (' ' + tail if tail else '')
+    return '('
+
+# _extract_first_paragraph helpers
+_PARAGRAPH_SPLIT = re.compile(r'\n\s*\n')
+_METADATA_PREFIX = re.compile(r'^(Page|Chapter|Section|\d+)', re.IGNORECASE)
+
+# Boilerplate preambles Claude sometimes adds despite the prompt, as a
+# single anchored alternation: one scan of the abstract instead of four
+_BOILERPLATE = re.compile(
+    r'^(?:Here is a (?:concise )?abstract[^:]*:\s*'
+    r'|This (?:document|paper|article) provides[^.]+\.\s*'
+    r'|(?:The following is |This is )?(?:a |an )?(?:\d+-word )?(?:abstract|summary)[^:]*:\s*'
+    r'|Abstract:\s*)',
+    re.IGNORECASE)
+
+
 class AbstractExtractor:
     def __init__(self, anthropic_client: Optional[Anthropic] = None):
         self.anthropic_client = anthropic_client
@@ -41,26 +126,10 @@ class AbstractExtractor:
         # For PDFs, first clean the content to fix extraction issues
         if doc_type == "pdf":
             # Apply basic cleaning to the entire content first
-            content = content.replace('ﬁ', 'fi').replace('ﬂ', 'fl').replace('ﬀ', 'ff')
-            content = content.replace('ﬃ', 'ffi').replace('ﬄ', 'ffl')
-        
-        # Common abstract patterns - updated for better matching
-        abstract_patterns = [
-            # Academic papers - handle various formats
-            # Look for Abstract section with flexible spacing
-            (r'(?:^|\n)\s*Abstract\s*[\n\s]+((?:[^\n][\n]?)+?)(?:\n\s*(?:1\.?\s*Introduction|Keywords?|Index Terms|I\.\s*INTRODUCTION|\n1\s+Introduction))', re.IGNORECASE | re.DOTALL),
-            # Some papers have abstract without explicit "Abstract" header
-            (r'^((?:[A-Z][^.!?]*[.!?]\s*){3,})(?:\n\s*(?:1\.?\s*Introduction|Keywords?|Index Terms))', re.MULTILINE | re.DOTALL),
-            # Summary patterns
-            (r'(?:^|\n)\s*Summary\s*[\n\s]+(.*?)(?:\n\s*(?:Introduction|1\.|I\.))', re.IGNORECASE | re.DOTALL),
-            (r'(?:^|\n)\s*Executive Summary\s*[\n\s]+(.*?)(?:\n\s*(?:Introduction|Background|1\.|I\.))', re.IGNORECASE | re.DOTALL),
-            # Markdown style
-            (r'(?:^|\n)#+\s*Abstract\s*\n+(.*?)(?:\n#|\n\n#|$)', re.IGNORECASE | re.DOTALL),
-            (r'(?:^|\n)#+\s*Summary\s*\n+(.*?)(?:\n#|\n\n#|$)', re.IGNORECASE | re.DOTALL),
-        ]
-        
-        for pattern, flags in abstract_patterns:
-            match = re.search(pattern, content, flags)
+            content = content.translate(_LIGATURE_TABLE)
+
+        for pattern in _ABSTRACT_PATTERNS:
+            match = pattern.search(content)
             if match:
                 abstract = match.group(1).strip()
                 
@@ -68,17 +137,8 @@ class AbstractExtractor:
                 if doc_type == "pdf" and len(abstract) > 1500:
                     # Might have grabbed too much, try to find the real end
                     # Look for common end markers
-                    end_markers = [
-                        r'\n\s*Keywords?:',
-                        r'\n\s*Index Terms:',
-                        r'\n\s*Categories and Subject Descriptors',
-                        r'\n\s*\d+\s*Introduction',
-                        r'\n\s*1\.\s*Introduction',
-                        r'\n\s*I\.\s*INTRODUCTION'
-                    ]
-                    
-                    for end_marker in end_markers:
-                        end_match = re.search(end_marker, abstract, re.IGNORECASE)
+                    for end_marker in _END_MARKERS:
+                        end_match = end_marker.search(abstract)
                         if end_match:
                             abstract = abstract[:end_match.start()]
                             break
@@ -98,51 +158,41 @@ class AbstractExtractor:
         
         # Fix merged words by adding spaces before capital letters that follow lowercase
         # but preserve acronyms and proper formatting
-        text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-        
-        # Fix specific patterns from academic PDFs
+        text = _MERGE_LOWER_UPPER.sub(r'\1 \2', text)
+
         # Fix "ﬁ" ligature and other common ligatures
-        text = text.replace('ﬁ', 'fi').replace('ﬂ', 'fl').replace('ﬀ', 'ff')
-        text = text.replace('ﬃ', 'ffi').replace('ﬄ', 'ffl')
-        
+        text = text.translate(_LIGATURE_TABLE)
+
         # Fix common merged words patterns
-        text = re.sub(r'([a-z])(learning|networks?|models?|systems?|based|recognition)', r'\1 \2', text, flags=re.IGNORECASE)
-        
-        # Remove hyphenation at line breaks (but keep real hyphens)
-        text = re.sub(r'([a-z])-\s*\n\s*([a-z])', r'\1\2', text)
-        
-        # Fix spacing around punctuation
-        text = re.sub(r'\s+([.,;:!?])', r'\1', text)  # Remove space before punctuation
-        text = re.sub(r'([.,;:!?])([A-Za-z])', r'\1 \2', text)  # Add space after punctuation if missing
-        
-        # Fix spacing around parentheses
-        text = re.sub(r'\s+\)', ')', text)
-        text = re.sub(r'\(\s+', '(', text)
-        text = re.sub(r'\)([A-Za-z])', r') \1', text)
-        
+        text = _MERGE_COMMON_WORDS.sub(r'\1 \2', text)
+
+        # Fix line-break hyphenation and spacing around punctuation and
+        # parentheses in a single pass
+        text = _SPACING_FIXES.sub(_spacing_fix, text)
+
         # Remove page numbers (standalone numbers)
-        text = re.sub(r'\n\s*\d+\s*\n', ' ', text)
-        text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)
-        
+        text = _INLINE_PAGE_NUMBER.sub(' ', text)
+        text = _STANDALONE_PAGE_NUMBER.sub('', text)
+
         # Clean up multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        
+        text = _MULTI_WHITESPACE.sub(' ', text)
+
         # Remove section headers that might have been included
-        text = re.sub(r'^(1\s+)?Introduction.*?(?=[A-Z])', '', text, flags=re.IGNORECASE)
-        
+        text = _LEADING_INTRO_HEADER.sub('', text)
+
         return text.strip()
     
     def _extract_first_paragraph(self, content: str) -> Optional[str]:
         """Extract the first substantial paragraph as abstract"""
         # Split into paragraphs
-        paragraphs = re.split(r'\n\s*\n', content.strip())
+        paragraphs = _PARAGRAPH_SPLIT.split(content.strip())
         
         for paragraph in paragraphs:
             # Skip very short paragraphs (likely titles or headers)
             if len(paragraph) < 100:
                 continue
             # Skip paragraphs that look like metadata
-            if re.match(r'^(Page|Chapter|Section|\d+)', paragraph, re.IGNORECASE):
+            if _METADATA_PREFIX.match(paragraph):
                 continue
             # Found a good paragraph
             return self._clean_abstract(paragraph)[:500]  # Limit length
@@ -152,29 +202,26 @@ class AbstractExtractor:
             return self._clean_abstract(content[:500])
         return None
     
-    def _generate_abstract_with_claude(self, content: str, doc_type: str, title: str) -> Optional[str]:
-        """Generate abstract using Claude API"""
-        if not self.anthropic_client:
-            return None
-        
-        try:
-            # Limit content length to avoid token limits
-            max_content_length = 4000
-            if len(content) > max_content_length:
-                # Take beginning and end to capture introduction and conclusion
-                content_sample = content[:2000] + "\n\n[...]\n\n" + content[-2000:]
-            else:
-                content_sample = content
-            
-            # Customize prompt based on document type
-            if doc_type == "pdf":
-                prompt_type = "academic or technical document"
-            elif doc_type == "md":
-                prompt_type = "markdown document"
-            else:
-                prompt_type = "document"
-            
-            prompt = f"""Generate an abstract for this {prompt_type}. Summarize the main points, key findings, and significance. Do not include any preamble or meta-commentary about the abstract itself. Start directly with the content summary.
+    def _build_abstract_prompt(self, content: str, doc_type: str, title: str) -> str:
+        """Build the abstract-generation prompt shared by the single and
+        batched Claude paths."""
+        # Limit content length to avoid token limits
+        max_content_length = 4000
+        if len(content) > max_content_length:
+            # Take beginning and end to capture introduction and conclusion
+            content_sample = content[:2000] + "\n\n[...]\n\n" + content[-2000:]
+        else:
+            content_sample = content
+
+        # Customize prompt based on document type
+        if doc_type == "pdf":
+            prompt_type = "academic or technical document"
+        elif doc_type == "md":
+            prompt_type = "markdown document"
+        else:
+            prompt_type = "document"
+
+        return f"""Generate an abstract for this {prompt_type}. Summarize the main points, key findings, and significance. Do not include any preamble or meta-commentary about the abstract itself. Start directly with the content summary.
 
 Title: {title}
 
@@ -182,42 +229,132 @@ Content:
 {content_sample}
 
 Abstract:"""
-            
+
+    def _strip_generation_boilerplate(self, abstract: str) -> Optional[str]:
+        """Remove preamble boilerplate from a Claude-generated abstract."""
+        abstract = _BOILERPLATE.sub('', abstract, count=1)
+
+        # Also remove if it starts with "This document" and continues about what the document does
+        if abstract.lower().startswith("this document"):
+            # Find the end of the first sentence
+            first_period = abstract.find('. ')
+            if first_period > 0 and first_period < 150:  # Reasonable length for a meta-sentence
+                # Check if it's talking about the document itself
+                first_sentence = abstract[:first_period].lower()
+                if any(word in first_sentence for word in ['provides', 'presents', 'describes', 'explains', 'discusses', 'outlines']):
+                    abstract = abstract[first_period + 2:].strip()
+
+        return abstract if abstract else None
+
+    def _generate_abstract_with_claude(self, content: str, doc_type: str, title: str) -> Optional[str]:
+        """Generate abstract using Claude API"""
+        if not self.anthropic_client:
+            return None
+
+        try:
+            prompt = self._build_abstract_prompt(content, doc_type, title)
+
             response = self.anthropic_client.messages.create(
                 model="claude-3-haiku-20240307",  # Use faster, cheaper model for abstracts
                 max_tokens=400,
                 temperature=0.3,  # Lower temperature for more focused summaries
                 messages=[{"role": "user", "content": prompt}]
             )
-            
-            abstract = response.content[0].text.strip()
-            
-            # Remove common boilerplate patterns
-            boilerplate_patterns = [
-                r'^Here is a (?:concise )?abstract[^:]*:\s*',
-                r'^This (?:document|paper|article) provides[^.]+\.\s*',
-                r'^(?:The following is |This is )?(?:a |an )?(?:\d+-word )?(?:abstract|summary)[^:]*:\s*',
-                r'^Abstract:\s*',
-            ]
-            
-            for pattern in boilerplate_patterns:
-                abstract = re.sub(pattern, '', abstract, flags=re.IGNORECASE)
-            
-            # Also remove if it starts with "This document" and continues about what the document does
-            if abstract.lower().startswith("this document"):
-                # Find the end of the first sentence
-                first_period = abstract.find('. ')
-                if first_period > 0 and first_period < 150:  # Reasonable length for a meta-sentence
-                    # Check if it's talking about the document itself
-                    first_sentence = abstract[:first_period].lower()
-                    if any(word in first_sentence for word in ['provides', 'presents', 'describes', 'explains', 'discusses', 'outlines']):
-                        abstract = abstract[first_period + 2:].strip()
-            
-            return abstract if abstract else None
-            
+
+            return self._strip_generation_boilerplate(response.content[0].text.strip())
+
         except Exception as e:
             print(f"Error generating abstract with Claude: {e}")
             return None
+
+    def extract_abstracts_bulk(self, items: list) -> list:
+        """
+        Extract or generate abstracts for many documents at once.
+
+        items is a list of (content, doc_type, title) tuples. Applies
+        the same tiers as extract_abstract - structural extraction,
+        then AI generation, then first paragraph - but runs the AI tier
+        as a single batched Claude call instead of one request per
+        document. Returns (abstract, source) tuples in input order.
+        """
+        results = [(None, None)] * len(items)
+
+        pending = []
+        for i, (content, doc_type, title) in enumerate(items):
+            abstract, source = self._try_extract_abstract(content, doc_type)
+            if abstract:
+                results[i] = (abstract, source)
+            else:
+                pending.append(i)
+
+        if pending and self.anthropic_client:
+            generated = self.generate_abstracts_bulk([items[i] for i in pending])
+            still_pending = []
+            for i, abstract in zip(pending, generated):
+                if abstract:
+                    results[i] = (abstract, "ai_generated")
+                else:
+                    still_pending.append(i)
+            pending = still_pending
+
+        for i in pending:
+            abstract = self._extract_first_paragraph(items[i][0])
+            if abstract:
+                results[i] = (abstract, "first_paragraph")
+
+        return results
+
+    def generate_abstracts_bulk(self, items: list) -> list:
+        """
+        Generate abstracts for many documents with one Message Batches call.
+
+        items is a list of (content, doc_type, title) tuples. Returns the
+        abstracts in input order, with None where generation failed. A
+        batch costs half the per-request price and runs the documents
+        concurrently on Anthropic's side, so total latency is roughly one
+        round-trip instead of one per document.
+        """
+        if not self.anthropic_client or not items:
+            return [None] * len(items)
+
+        try:
+            requests = [
+                {
+                    "custom_id": f"abstract-{i}",
+                    "params": {
+                        "model": "claude-3-haiku-20240307",
+                        "max_tokens": 400,
+                        "temperature": 0.3,
+                        "messages": [{
+                            "role": "user",
+                            "content": self._build_abstract_prompt(content, doc_type, title)
+                        }]
+                    }
+                }
+                for i, (content, doc_type, title) in enumerate(items)
+            ]
+
+            batch = self.anthropic_client.messages.batches.create(requests=requests)
+            deadline = time.monotonic() + _BATCH_POLL_TIMEOUT
+            while batch.processing_status != "ended":
+                if time.monotonic() >= deadline:
+                    print(f"Timed out waiting for abstract batch {batch.id} "
+                          f"after {_BATCH_POLL_TIMEOUT}s")
+                    return [None] * len(items)
+                time.sleep(2)
+                batch = self.anthropic_client.messages.batches.retrieve(batch.id)
+
+            abstracts = [None] * len(items)
+            for result in self.anthropic_client.messages.batches.results(batch.id):
+                if result.result.type == "succeeded":
+                    index = int(result.custom_id.rsplit("-", 1)[1])
+                    text = result.result.message.content[0].text.strip()
+                    abstracts[index] = self._strip_generation_boilerplate(text)
+            return abstracts
+
+        except Exception as e:
+            print(f"Error generating abstracts in batch: {e}")
+            return [None] * len(items)
     
     def extract_pdf_abstract(self, pdf_content: bytes) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -237,13 +374,16 @@ Abstract:"""
                         if abstract and len(abstract) > 50:
                             return abstract.strip(), "extracted"
             
-            # Extract text from first few pages to look for abstract
-            text_content = ""
+            # Extract text page by page: most abstracts sit on page 1, so
+            # returning as soon as one matches skips decompressing and
+            # interpreting the remaining pages - the dominant cost here
+            page_texts = []
             for page_num in range(min(5, len(pdf_reader.pages))):
-                text_content += pdf_reader.pages[page_num].extract_text() + "\n\n"
-            
-            # Try to extract abstract from content
-            return self._try_extract_abstract(text_content, "pdf")
+                page_texts.append(pdf_reader.pages[page_num].extract_text())
+                abstract, source = self._try_extract_abstract("\n\n".join(page_texts), "pdf")
+                if abstract:
+                    return abstract, source
+            return None, None
             
         except Exception as e:
             print(f"Error extracting PDF abstract: {e}")
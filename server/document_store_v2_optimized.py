@@ -2,6 +2,7 @@ import os
 from typing import List, Dict, Optional
 from datetime import datetime
 import chromadb
+import numpy as np
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 from sqlalchemy.orm import Session
@@ -49,6 +50,46 @@ class DocumentStoreV2Optimized:
         self.embedding_dim = 384
         if load_model:
             self._load_model()
+
+        # Lazily-built in-process mirror of the embedding matrix used for
+        # top-k search; rebuilt on demand after any write
+        self._embedding_matrix = None
+        self._matrix_ids = None
+
+        # Optional callback fired on every write alongside the matrix
+        # invalidation. The server registers its endpoint-level cache
+        # invalidation here so no write path can forget to run it.
+        self.on_mutation = None
+
+    def _invalidate_matrix(self):
+        self._embedding_matrix = None
+        self._matrix_ids = None
+        if self.on_mutation is not None:
+            self.on_mutation()
+
+    def _get_embedding_matrix(self):
+        """Return (ids, L2-normalized float32 matrix) for the collection.
+
+        Keeping a contiguous numpy mirror avoids ChromaDB's per-query
+        serialization overhead; one matmul against it answers a search.
+
+        The mirror is revalidated against collection.count(), which reads
+        ChromaDB's shared storage: when several worker processes serve
+        the same database, a document added or deleted through one
+        worker forces the others to rebuild instead of serving a stale
+        matrix forever.
+        """
+        if (self._matrix_ids is not None
+                and len(self._matrix_ids) != self.collection.count()):
+            self._invalidate_matrix()
+        if self._embedding_matrix is None:
+            all_data = self.collection.get(include=['embeddings'])
+            matrix = np.asarray(all_data['embeddings'], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1
+            self._embedding_matrix = np.ascontiguousarray(matrix / norms)
+            self._matrix_ids = all_data['ids']
+        return self._matrix_ids, self._embedding_matrix
     
     def _load_model(self):
         """Lazy load the sentence transformer model"""
@@ -99,6 +140,7 @@ class DocumentStoreV2Optimized:
             )
             
             session.commit()
+            self._invalidate_matrix()
             
             # Update document count in database manager
             self.db_manager.update_document_count()
@@ -111,44 +153,187 @@ class DocumentStoreV2Optimized:
         finally:
             session.close()
     
+    def add_documents_bulk(self, items: List[Dict]) -> List[str]:
+        """Add many documents in one pass.
+
+        Each item is a dict of add_document keyword arguments ('title' and
+        'content' required). All contents are encoded with a single
+        model.encode call and written to ChromaDB and SQLite in one
+        round-trip each, instead of paying a forward pass plus two writes
+        per document.
+        """
+        if not items:
+            return []
+
+        # Ensure model is loaded for embedding generation
+        self._load_model()
+
+        session = get_session(self.engine)
+
+        try:
+            base_count = self.collection.count()
+            now = datetime.now()
+            timestamp = int(now.timestamp())
+            ids = [f"doc_{base_count + i + 1}_{timestamp}" for i in range(len(items))]
+
+            mappings = [{
+                'id': doc_id,
+                'title': item['title'],
+                'content': item['content'],
+                'doc_type': item.get('doc_type'),
+                'tags': item.get('tags'),
+                'abstract': item.get('abstract'),
+                'abstract_source': item.get('abstract_source'),
+                'source': item.get('source'),
+                'authors': item.get('authors'),
+                'created_at': now,
+                'updated_at': now
+            } for doc_id, item in zip(ids, items)]
+            session.bulk_insert_mappings(Document, mappings)
+
+            # One batched encode for all contents (only content, not tags).
+            # Encoding in length order groups similar-length texts into the
+            # same batch, so each batch pads to roughly its own longest
+            # member instead of the longest text overall.
+            contents = [item['content'] for item in items]
+            order = sorted(range(len(contents)), key=lambda i: len(contents[i]))
+            sorted_embeddings = self.model.encode(
+                [contents[i] for i in order],
+                batch_size=64,
+                convert_to_numpy=True,
+                show_progress_bar=False
+            )
+            embeddings = sorted_embeddings[np.argsort(order)]
+
+            self.collection.add(
+                ids=ids,
+                embeddings=embeddings.tolist(),
+                metadatas=[{
+                    "title": item['title'],
+                    "created_at": now.isoformat()
+                } for item in items]
+            )
+
+            session.commit()
+            self._invalidate_matrix()
+
+            # Update document count in database manager
+            self.db_manager.update_document_count()
+
+            return ids
+
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+
+    def embed_query(self, query: str) -> np.ndarray:
+        """Encode a query string into a float32 embedding"""
+        self._load_model()
+        return self.model.encode(query, convert_to_numpy=True).astype(np.float32)
+
     def search(self, query: str, k: int = 5) -> List[Dict]:
         """Search for documents using semantic similarity"""
         if self.collection.count() == 0:
             return []
-        
-        # Ensure model is loaded for query embedding
+
+        return self.search_by_embedding(self.embed_query(query), k)
+
+    def search_batch(self, queries: List[str], k: int = 5) -> List[List[Dict]]:
+        """Run several searches in one encoder pass and one ChromaDB query.
+
+        Encoding all queries together amortizes tokenization and the
+        model forward pass, and ChromaDB accepts multiple query
+        embeddings per call, so Q searches cost one RPC instead of Q.
+        """
+        if not queries or self.collection.count() == 0:
+            return [[] for _ in queries]
+
         self._load_model()
-        
-        # Generate query embedding
-        query_embedding = self.model.encode(query).tolist()
-        
-        # Search in ChromaDB
+        embeddings = self.model.encode(
+            queries,
+            batch_size=32,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=embeddings.tolist(),
             n_results=min(k, self.collection.count())
         )
-        
+
+        session = get_session(self.engine)
+        try:
+            all_docs = session.query(Document).order_by(Document.created_at).all()
+            doc_id_to_index = {doc.id: idx + 1 for idx, doc in enumerate(all_docs)}
+            docs_by_id = {doc.id: doc for doc in all_docs}
+
+            batched_results = []
+            for ids, distances in zip(results['ids'], results['distances']):
+                search_results = []
+                for doc_id, distance in zip(ids, distances):
+                    document = docs_by_id.get(doc_id)
+                    if document:
+                        result = document.to_dict()
+                        result['similarity_score'] = 1 - distance
+                        result['index'] = doc_id_to_index.get(doc_id, 0)
+                        search_results.append(result)
+                batched_results.append(search_results)
+
+            return batched_results
+
+        finally:
+            session.close()
+
+    def search_by_embedding(self, query_embedding, k: int = 5) -> List[Dict]:
+        """Search for documents given an already-computed query embedding.
+
+        Split out from search() so callers that cache query embeddings
+        can skip the transformer forward pass entirely.
+        """
+        if self.collection.count() == 0:
+            return []
+
+        ids, matrix = self._get_embedding_matrix()
+        if len(ids) == 0:
+            return []
+
+        query_vec = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query_vec)
+        if norm > 0:
+            query_vec = query_vec / norm
+
+        # One matmul against the resident matrix, then an O(N)
+        # argpartition for the top k (vs argsort's O(N log N)), sorting
+        # only the k winners
+        scores = matrix @ query_vec
+        k = min(k, len(ids))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
         # Get full documents from SQLite
         session = get_session(self.engine)
         search_results = []
-        
+
         try:
             # Get all documents ordered by created_at to find their index
             all_docs = session.query(Document).order_by(Document.created_at).all()
             doc_id_to_index = {doc.id: idx + 1 for idx, doc in enumerate(all_docs)}
-            
-            for idx, doc_id in enumerate(results['ids'][0]):
-                document = session.query(Document).filter_by(id=doc_id).first()
+            docs_by_id = {doc.id: doc for doc in all_docs}
+
+            for idx in top:
+                doc_id = ids[idx]
+                document = docs_by_id.get(doc_id)
                 if document:
                     result = document.to_dict()
-                    # Add similarity score (convert distance to similarity)
-                    result['similarity_score'] = 1 - results['distances'][0][idx]
+                    result['similarity_score'] = float(scores[idx])
                     # Add the document's actual index
                     result['index'] = doc_id_to_index.get(doc_id, 0)
                     search_results.append(result)
-            
+
             return search_results
-            
+
         finally:
             session.close()
     
@@ -161,6 +346,48 @@ class DocumentStoreV2Optimized:
         finally:
             session.close()
     
+    def get_all_documents_metadata(self) -> List[Dict]:
+        """Get id/title/type/tags metadata for all documents - no model needed.
+
+        Skips the content column, so the query stays cheap even when the
+        corpus holds megabytes of text.
+        """
+        session = get_session(self.engine)
+        try:
+            rows = session.query(
+                Document.id, Document.title, Document.doc_type,
+                Document.tags, Document.created_at
+            ).all()
+            return [{
+                'id': row.id,
+                'title': row.title,
+                'doc_type': row.doc_type,
+                'tags': row.tags,
+                'created_at': row.created_at.isoformat() if row.created_at else None
+            } for row in rows]
+        finally:
+            session.close()
+
+    def get_documents_by_ids(self, doc_ids: List[str]) -> List[Dict]:
+        """Get full documents for a list of IDs in one query - no model needed"""
+        if not doc_ids:
+            return []
+        session = get_session(self.engine)
+        try:
+            documents = session.query(Document).filter(Document.id.in_(doc_ids)).all()
+            return [doc.to_dict() for doc in documents]
+        finally:
+            session.close()
+
+    def get_document(self, doc_id: str) -> Optional[Dict]:
+        """Get a single document by ID (indexed lookup) - no model needed"""
+        session = get_session(self.engine)
+        try:
+            document = session.query(Document).filter_by(id=doc_id).first()
+            return document.to_dict() if document else None
+        finally:
+            session.close()
+
     def get_document_by_index(self, index: int) -> Optional[Dict]:
         """Get document by index (1-based) - no model needed"""
         session = get_session(self.engine)
@@ -191,6 +418,7 @@ class DocumentStoreV2Optimized:
             self.collection.delete(ids=[doc_id])
             
             session.commit()
+            self._invalidate_matrix()
             
             # Update document count in database manager
             self.db_manager.update_document_count()
@@ -245,6 +473,7 @@ class DocumentStoreV2Optimized:
                 name="documents",
                 metadata={"hnsw:space": "cosine"}
             )
+            self._invalidate_matrix()
             
             return count
         except Exception as e:
@@ -326,6 +555,7 @@ class DocumentStoreV2Optimized:
                         "doc_type": document.doc_type or ""
                     }]
                 )
+                self._invalidate_matrix()
             else:
                 # Just update metadata if content wasn't changed
                 self.collection.update(
@@ -4,7 +4,6 @@ Batch process existing documents to generate abstracts
 """
 
 import sys
-import time
 from pathlib import Path
 from database_manager import get_database_manager
 from document_store_v2_optimized import DocumentStoreV2Optimized as DocumentStoreV2
@@ -35,66 +34,65 @@ def process_database(db_id: str, db_name: str, abstract_extractor: AbstractExtra
     processed = 0
     skipped = 0
     errors = 0
-    
-    for i, doc in enumerate(docs_without_abstracts, 1):
-        doc_id = doc['id']
-        title = doc['title']
+
+    # Build (content, doc_type, title) items for the extractor
+    items = []
+    for doc in docs_without_abstracts:
         content = doc['content']
         doc_type = doc.get('doc_type', 'txt')
-        
+
+        # For PDFs, check if content has PDF metadata
+        if doc_type == 'pdf' and '[PDF_FILE:' in content:
+            # Extract clean text content (remove metadata)
+            clean_content = content
+            if '[PDF_META:' in content:
+                meta_end = content.find(']\n\n', content.find('[PDF_META:'))
+                if meta_end > 0:
+                    clean_content = content[meta_end + 3:]
+            else:
+                file_end = content.find(']\n\n', content.find('[PDF_FILE:'))
+                if file_end > 0:
+                    clean_content = content[file_end + 3:]
+            content_for_abstract = clean_content
+        else:
+            content_for_abstract = content
+
+        items.append((content_for_abstract, doc_type, doc['title']))
+
+    # Structural extraction per document, then one batched Claude call
+    # for whatever is left - no per-document API round-trips or rate-
+    # limiting sleeps
+    results = abstract_extractor.extract_abstracts_bulk(items)
+
+    for i, (doc, (abstract, abstract_source)) in enumerate(
+            zip(docs_without_abstracts, results), 1):
+        title = doc['title']
         print(f"\n[{i}/{len(docs_without_abstracts)}] Processing: {title[:50]}...")
-        
+
+        if not abstract:
+            print(f"  ⚠ Could not generate abstract")
+            skipped += 1
+            continue
+
+        print(f"  ✓ Generated abstract ({abstract_source}): {abstract[:100]}...")
+
+        if dry_run:
+            processed += 1
+            continue
+
         try:
-            # For PDFs, check if content has PDF metadata
-            if doc_type == 'pdf' and '[PDF_FILE:' in content:
-                # Extract clean text content (remove metadata)
-                clean_content = content
-                if '[PDF_META:' in content:
-                    meta_end = content.find(']\n\n', content.find('[PDF_META:'))
-                    if meta_end > 0:
-                        clean_content = content[meta_end + 3:]
-                else:
-                    file_end = content.find(']\n\n', content.find('[PDF_FILE:'))
-                    if file_end > 0:
-                        clean_content = content[file_end + 3:]
-                content_for_abstract = clean_content
-            else:
-                content_for_abstract = content
-            
-            # Extract abstract
-            abstract, abstract_source = abstract_extractor.extract_abstract(
-                content_for_abstract, 
-                doc_type, 
-                title
+            # Update document with abstract
+            success = document_store.update_document(
+                doc['id'],
+                abstract=abstract,
+                abstract_source=abstract_source
             )
-            
-            if not abstract:
-                print(f"  ⚠ Could not generate abstract")
-                skipped += 1
-                continue
-            
-            print(f"  ✓ Generated abstract ({abstract_source}): {abstract[:100]}...")
-            
-            if not dry_run:
-                # Update document with abstract
-                success = document_store.update_document(
-                    doc_id,
-                    abstract=abstract,
-                    abstract_source=abstract_source
-                )
-                
-                if success:
-                    processed += 1
-                else:
-                    print(f"  ✗ Failed to update document")
-                    errors += 1
-            else:
+
+            if success:
                 processed += 1
-            
-            # Rate limiting for AI generation
-            if abstract_source == "ai_generated" and use_ai:
-                time.sleep(0.5)  # Be nice to the API
-                
+            else:
+                print(f"  ✗ Failed to update document")
+                errors += 1
         except Exception as e:
             print(f"  ✗ Error: {e}")
             errors += 1
@@ -16,6 +16,12 @@ def migrate_database(db_path):
     cursor = conn.cursor()
     
     try:
+        # One-shot migration with a pre-existing backup: skip per-statement
+        # fsyncs and keep the journal in memory, then restore the defaults
+        # below. A crash mid-migration just means re-running from backup.
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        
         # Check if columns already exist
         cursor.execute("PRAGMA table_info(documents)")
         columns = [col[1] for col in cursor.fetchall()]
@@ -32,6 +38,8 @@ def migrate_database(db_path):
         else:
             print("  'abstract_source' column already exists")
             
+        cursor.execute("PRAGMA synchronous=FULL")
+        cursor.execute("PRAGMA journal_mode=DELETE")
         conn.commit()
         print(f"  ✓ Migration completed for {db_path}")
         
@@ -22,20 +22,24 @@ class PDFExtractor:
         # First try metadata
         title_from_metadata = self._extract_title_from_metadata(pdf_reader)
         
-        # Extract text from first few pages for title/abstract detection
-        first_pages_text = ""
-        full_text = ""
+        # Extract text from first few pages for title/abstract detection.
+        # Page texts are collected in lists and joined once; += per page
+        # recopies the accumulated string every iteration.
+        first_pages = []
+        full_pages = []
         
         for i, page in enumerate(pdf_reader.pages):
             page_text = page.extract_text()
             
             # For the first few pages, keep original formatting for better title/abstract extraction
             if i < 3:
-                first_pages_text += page_text + "\n"
+                first_pages.append(page_text)
             
             # For full text, clean it up
-            cleaned_text = self._basic_clean_text(page_text)
-            full_text += cleaned_text + "\n\n"
+            full_pages.append(self._basic_clean_text(page_text))
+        
+        first_pages_text = "\n".join(first_pages) + ("\n" if first_pages else "")
+        full_text = "\n\n".join(full_pages) + ("\n\n" if full_pages else "")
         
         # Extract title from content if not in metadata
         title = title_from_metadata
@@ -23,21 +23,24 @@ class PDFExtractorV2:
         # First try metadata
         title_from_metadata = self._extract_title_from_metadata(pdf_reader)
         
-        # Extract text from first few pages for title/abstract detection
-        first_pages_text = ""
-        full_text = ""
+        # Extract text from first few pages for title/abstract detection.
+        # Accumulate page texts in lists and join once at the end; the
+        # repeated += built a fresh string per page, O(n^2) on long PDFs.
+        first_pages = []
+        full_pages = []
         
         for i, page in enumerate(pdf_reader.pages):
             page_text = page.extract_text()
             
             # Apply aggressive text cleaning for better extraction
             if i < 3:  # First 3 pages for title/abstract
-                cleaned_for_extraction = self._aggressive_clean_text(page_text)
-                first_pages_text += cleaned_for_extraction + "\n"
+                first_pages.append(self._aggressive_clean_text(page_text))
             
             # For full text, use moderate cleaning
-            cleaned_text = self._moderate_clean_text(page_text)
-            full_text += cleaned_text + "\n\n"
+            full_pages.append(self._moderate_clean_text(page_text))
+        
+        first_pages_text = "\n".join(first_pages) + ("\n" if first_pages else "")
+        full_text = "\n\n".join(full_pages) + ("\n\n" if full_pages else "")
         
         # Extract title from content if not in metadata
         title = title_from_metadata